@@ -245,7 +245,8 @@ class _AtomArrayBase(Copyable, metaclass=abc.ABCMeta):
         equality : bool
             True, if the annotation array names are equal.
         """
-        return sorted(self._annot.keys()) == sorted(item._annot.keys())
+        # Key views are compared like sets, no sorting required
+        return self._annot.keys() == item._annot.keys()
     
     def __getattr__(self, attr):
         """
@@ -361,6 +362,16 @@ class _AtomArrayBase(Copyable, metaclass=abc.ABCMeta):
         --------
         equal_annotations
         """
+        # Do the cheap checks first,
+        # before any array is compared element-wise
+        if not isinstance(item, _AtomArrayBase):
+            return False
+        if self._array_length != item._array_length:
+            return False
+        if not self.equal_annotation_categories(item):
+            return False
+        if not np.array_equal(self._coord, item._coord):
+            return False
         if not self.equal_annotations(item):
             return False
         if self._bonds != item._bonds:
@@ -371,7 +382,7 @@ class _AtomArrayBase(Copyable, metaclass=abc.ABCMeta):
         else:
             if not np.array_equal(self._box, item._box):
                 return False
-        return np.array_equal(self._coord, item._coord)
+        return True
     
     def __len__(self):
         """
@@ -796,11 +807,9 @@ class AtomArray(_AtomArrayBase):
             True, if `item` is an :class:`AtomArray`
             and all its attribute arrays equals the ones of this object.
         """
-        if not super().__eq__(item):
-            return False
         if not isinstance(item, AtomArray):
             return False
-        return True
+        return super().__eq__(item)
     
     def __str__(self):
         """
@@ -1107,11 +1116,9 @@ class AtomArrayStack(_AtomArrayBase):
             True, if `item` is an :class:`AtomArray`
             and all its attribute arrays equals the ones of this object.
         """
-        if not super().__eq__(item):
-            return False
         if not isinstance(item, AtomArrayStack):
             return False
-        return True
+        return super().__eq__(item)
     
     def __str__(self):
         """
@@ -1170,10 +1177,16 @@ def array(atoms):
             )
     # Add all atoms to AtomArray
     array = AtomArray(len(atoms))
-    for i in range(len(atoms)):
-        for name in names:
-            array._annot[name][i] = atoms[i]._annot[name]
-        array._coord[i] = atoms[i].coord
+    # Fill the annotation arrays column by column,
+    # instead of assigning each single element
+    for name in names:
+        values = [atom._annot[name] for atom in atoms]
+        if name in array._annot:
+            # Keep the dtype of the default annotation arrays
+            array._annot[name][:] = values
+        else:
+            array.set_annotation(name, np.array(values))
+    array._coord[:] = [atom.coord for atom in atoms]
     return array
 
 
@@ -516,58 +516,58 @@ class BondList(Copyable):
         return merged_bond_list
 
     def __getitem__(self, index):
-        copy = self.copy()
-        cdef uint32[:,:] all_bonds_v = copy._bonds
+        cdef uint32[:,:] all_bonds_v = self._bonds
         # Boolean mask representation of the index
         cdef np.ndarray mask
         cdef uint8[:] mask_v
-        # Boolean mask for removal of bonds
-        cdef np.ndarray removal_filter
-        cdef uint8[:] removal_filter_v
-        cdef np.ndarray offsets
-        cdef uint32[:] offsets_v
-        cdef int i
-        cdef uint32* index1_ptr
-        cdef uint32* index2_ptr
+        # Lookup table for the new index of each atom
+        cdef np.ndarray remap
+        cdef uint32[:] remap_v
+        cdef np.ndarray filtered_bonds
+        cdef uint32[:,:] filtered_bonds_v
+        cdef int i, j
+        cdef uint32 index1, index2
+        cdef int bond_count
         
         if isinstance(index, numbers.Integral):
-            return copy.get_bonds(index)
+            return self.get_bonds(index)
         
         else:
-            mask = _to_bool_mask(index, length=copy._atom_count)
-            # Each time an atom is missing in the mask,
-            # the offset is increased by one
-            offsets = np.cumsum(~mask.astype(bool, copy=False),
-                                dtype=np.uint32)
-            removal_filter = np.ones(all_bonds_v.shape[0], dtype=np.uint8)
+            mask = _to_bool_mask(index, length=self._atom_count)
             mask_v = mask
-            offsets_v = offsets
-            removal_filter_v = removal_filter
+            # Removing atoms in an AtomArray
+            # decreases the index of the following atoms
+            # -> the new index of a masked atom is the number of
+            # masked atoms before it
+            remap = np.cumsum(mask, dtype=np.uint32) - 1
+            remap_v = remap
             # If an atom in a bond is not masked,
             # the bond is removed from the list
-            # If an atom is masked,
-            # its index value is decreased by the respective offset
-            # The offset is neccessary, removing atoms in an AtomArray
-            # decreases the index of the following atoms
+            # -> count the remaining bonds first
+            # to allocate the filtered bonds without trimming
+            bond_count = 0
             for i in range(all_bonds_v.shape[0]):
-                # Usage of pointer to increase performance
-                # as redundant indexing is avoided
-                index1_ptr = &all_bonds_v[i,0]
-                index2_ptr = &all_bonds_v[i,1]
-                if mask_v[index1_ptr[0]] and mask_v[index2_ptr[0]]:
-                    # Both atoms involved in bond are masked
-                    # -> decrease atom index by offset
-                    index1_ptr[0] -= offsets_v[index1_ptr[0]]
-                    index2_ptr[0] -= offsets_v[index2_ptr[0]]
-                else:
-                    # At least one atom invloved in bond is not masked
-                    # -> remove bond
-                    removal_filter_v[i] = False
-            # Apply the bond removal filter
-            copy._bonds = copy._bonds[removal_filter.astype(bool, copy=False)]
-            copy._atom_count = len(np.nonzero(mask)[0])
-            copy._max_bonds_per_atom = copy._get_max_bonds_per_atom()
-            return copy
+                if mask_v[all_bonds_v[i,0]] and mask_v[all_bonds_v[i,1]]:
+                    bond_count += 1
+            filtered_bonds = np.empty((bond_count, 3), dtype=np.uint32)
+            filtered_bonds_v = filtered_bonds
+            # Write the remaining bonds with the new atom indices
+            j = 0
+            for i in range(all_bonds_v.shape[0]):
+                index1 = all_bonds_v[i,0]
+                index2 = all_bonds_v[i,1]
+                if mask_v[index1] and mask_v[index2]:
+                    filtered_bonds_v[j,0] = remap_v[index1]
+                    filtered_bonds_v[j,1] = remap_v[index2]
+                    filtered_bonds_v[j,2] = all_bonds_v[i,2]
+                    j += 1
+            # Create empty bond list to prevent
+            # unnecessary removal of redundant atoms
+            bond_list = BondList(np.count_nonzero(mask))
+            bond_list._bonds = filtered_bonds
+            bond_list._max_bonds_per_atom \
+                = bond_list._get_max_bonds_per_atom()
+            return bond_list
     
     def __iter__(self):
         raise TypeError("'BondList' object is not iterable")
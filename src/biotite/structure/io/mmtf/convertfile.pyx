@@ -119,7 +119,10 @@ def get_structure(file, model=None, altloc="first",
     cdef np.ndarray x_coord = file["xCoordList"]
     cdef np.ndarray y_coord = file["yCoordList"]
     cdef np.ndarray z_coord = file["zCoordList"]
-    cdef np.ndarray occupancy = file.get("occupancyList")
+    cdef np.ndarray occupancy
+    # Occupancy is only decoded if it is actually used
+    if "occupancy" in extra_fields or altloc == "occupancy":
+        occupancy = file.get("occupancyList")
     cdef np.ndarray b_factor
     if "b_factor" in extra_fields:
         b_factor = file["bFactorList"]
@@ -138,9 +141,10 @@ def get_structure(file, model=None, altloc="first",
                                  "DNA LINKING", "RNA LINKING"]
     # Determine per-residue-count and maximum count
     # of atoms in each residue
-    cdef np.ndarray atoms_per_res = np.zeros(len(group_list), dtype=np.int32)
-    for i in range(len(group_list)):
-        atoms_per_res[i] = len(group_list[i]["atomNameList"])
+    cdef np.ndarray atoms_per_res = np.array(
+        [len(residue["atomNameList"]) for residue in group_list],
+        dtype=np.int32
+    )
     cdef int32 max_atoms_per_res = np.max(atoms_per_res)
     #Create the arrays
     cdef np.ndarray res_names = np.zeros(len(group_list), dtype="U3")
@@ -159,6 +163,9 @@ def get_structure(file, model=None, altloc="first",
         atom_names[i, :atoms_per_res[i]] = residue["atomNameList"]
         elements[i, :atoms_per_res[i]] = residue["elementList"]
         charges[i, :atoms_per_res[i]] = residue["formalChargeList"]
+    # Convert element names to upper case once per residue type,
+    # instead of once for each atom
+    elements = np.char.upper(elements)
     
 
     # Create the atom array (stack)
@@ -358,72 +365,45 @@ def _fill_annotations(int model, array,
                       np.ndarray atom_names,
                       np.ndarray elements,
                       np.ndarray charges):
-    # Get annotation arrays from atom array (stack)
-    cdef np.ndarray chain_id  = array.chain_id
-    cdef np.ndarray res_id    = array.res_id
-    cdef np.ndarray ins_code  = array.ins_code
-    cdef np.ndarray res_name  = array.res_name
-    cdef np.ndarray hetero    = array.hetero
-    cdef np.ndarray atom_name = array.atom_name
-    cdef np.ndarray element   = array.element
-    if extra_charge:
-        charge = array.charge
-
-    cdef int model_i = 0
-    cdef int chain_i = 0
-    cdef int res_i
-    cdef int atom_i = 0
-    cdef int res_count_in_chain = 0
-    cdef int chain_count_in_model = 0
-    cdef int atom_index_in_res
+    # Instead of iterating over each atom, the per-residue and
+    # per-residue-type data is gathered for all atoms at once
 
-    cdef chain_id_for_chain
-    cdef res_name_for_res
-    cdef inscode_for_res
-    cdef bint hetero_for_res
-    cdef int res_id_for_res
-    cdef int type_i
+    # Map each residue to its chain and each chain to its model
+    cdef np.ndarray chain_of_res = np.repeat(
+        np.arange(res_per_chain.shape[0]), np.asarray(res_per_chain)
+    )
+    cdef np.ndarray model_of_chain = np.repeat(
+        np.arange(chains_per_model.shape[0]), np.asarray(chains_per_model)
+    )
+    # Residues of the given model
+    cdef np.ndarray res_mask = (model_of_chain[chain_of_res] == model-1)
+    chain_of_res = chain_of_res[res_mask]
+    cdef np.ndarray type_of_res = np.asarray(res_type_i)[res_mask]
+    cdef np.ndarray atom_count_of_res = atoms_per_res[type_of_res]
 
-    # The length of 'res_type_i'
-    # is equal to the total number of residues
-    for res_i in range(res_type_i.shape[0]):
-        # Wait for the data of the given model
-        if model_i == model-1: 
-            chain_id_for_chain = chain_names[chain_i]
-            res_id_for_res = res_ids[res_i]
-            if res_inscodes is not None:
-                inscode_for_res = res_inscodes[res_i]
-            type_i = res_type_i[res_i]
-            res_name_for_res = res_names[type_i]
-            hetero_for_res = hetero_res[type_i]
+    # Residue type of each atom and the index of the atom in the residue
+    cdef np.ndarray type_of_atom = np.repeat(type_of_res, atom_count_of_res)
+    cdef np.ndarray res_starts = np.cumsum(atom_count_of_res) \
+                                 - atom_count_of_res
+    cdef np.ndarray index_in_res = np.arange(type_of_atom.shape[0]) \
+                                   - np.repeat(res_starts, atom_count_of_res)
 
-            for atom_index_in_res in range(atoms_per_res[type_i]):
-                chain_id[atom_i]  = chain_id_for_chain
-                res_id[atom_i]    = res_id_for_res
-                ins_code[atom_i]  = inscode_for_res
-                hetero[atom_i]    = hetero_for_res
-                res_name[atom_i]  = res_name_for_res
-                atom_name[atom_i] = atom_names[type_i][atom_index_in_res]
-                element[atom_i]   = elements[type_i][atom_index_in_res].upper()
-                if extra_charge:
-                    charge[atom_i] = charges[type_i][atom_index_in_res]
-                atom_i += 1
-        
-        elif model_i > model-1:
-            # The given model has already been parsed
-            # -> parsing is finished
-            break
-        
-        res_count_in_chain += 1
-        if res_count_in_chain == res_per_chain[chain_i]:
-            # Chain is full -> Bump chain index and reset residue count
-            res_count_in_chain = 0
-            chain_i += 1
-            chain_count_in_model += 1
-        if chain_count_in_model == chains_per_model[model_i]:
-            # Model is full -> Bump model index and reset chain count
-            chain_count_in_model = 0
-            model_i += 1
+    array.chain_id[...] = np.repeat(
+        chain_names[chain_of_res], atom_count_of_res
+    )
+    array.res_id[...] = np.repeat(
+        np.asarray(res_ids)[res_mask], atom_count_of_res
+    )
+    if res_inscodes is not None:
+        array.ins_code[...] = np.repeat(
+            res_inscodes[res_mask], atom_count_of_res
+        )
+    array.res_name[...] = res_names[type_of_atom]
+    array.hetero[...] = hetero_res[type_of_atom]
+    array.atom_name[...] = atom_names[type_of_atom, index_in_res]
+    array.element[...] = elements[type_of_atom, index_in_res]
+    if extra_charge:
+        array.charge[...] = charges[type_of_atom, index_in_res]
 
 
 def _create_bond_list(int model, np.ndarray bonds, np.ndarray bond_types,
@@ -435,9 +415,10 @@ def _create_bond_list(int model, np.ndarray bonds, np.ndarray bond_types,
 
     # Determine per-residue-count and maximum count
     # of bonds in each residue
-    cdef int32[:] bonds_per_res = np.zeros(len(group_list), dtype=np.int32)
-    for i in range(len(group_list)):
-        bonds_per_res[i] = len(group_list[i]["bondOrderList"])
+    cdef int32[:] bonds_per_res = np.array(
+        [len(residue["bondOrderList"]) for residue in group_list],
+        dtype=np.int32
+    )
     cdef int32 max_bonds_per_res = np.max(bonds_per_res)
 
     # Create arrays for intra-residue bonds and bond types
@@ -450,8 +431,7 @@ def _create_bond_list(int model, np.ndarray bonds, np.ndarray bond_types,
     for i in range(len(group_list)):
         residue = group_list[i]
         bonds_in_residue = np.array(residue["bondAtomList"], dtype=np.uint32)
-        intra_bonds[i, :bonds_per_res[i], :2] = \
-            np.array(residue["bondAtomList"], dtype=np.uint32).reshape((-1, 2))
+        intra_bonds[i, :bonds_per_res[i], :2] = bonds_in_residue.reshape((-1, 2))
         intra_bonds[i, :bonds_per_res[i], 2] = residue["bondOrderList"]
 
     # Unify intra-residue bonds to one BondList
@@ -21,7 +21,11 @@ ctypedef np.uint64_t uint64
 ctypedef np.float32_t float32
 
 
-def decode_array(int codec, bytes raw_bytes, int param):
+def decode_array(int codec, raw_bytes, int param, int length):
+    # 'raw_bytes' may be any object supporting the buffer protocol,
+    # e.g. a 'memoryview' of the encoded data
+    # 'length' is the length of the decoded array given in the header,
+    # it is used to allocate the output arrays with the final size
     cdef np.ndarray array
     # Pass-through: 32-bit floating-point number array
     if   codec == 1:
@@ -45,108 +49,202 @@ def decode_array(int codec, bytes raw_bytes, int param):
         return array.astype(np.dtype("U" + str(param)))
     # Run-length encoded character array
     elif codec == 6:
-        array = np.frombuffer(raw_bytes, dtype=">i4").astype(np.int32)
-        return np.frombuffer(_decode_run_length(array), dtype="U1")
+        return np.frombuffer(
+            _decode_run_length(raw_bytes, length), dtype="U1"
+        )
     # Run-length encoded 32-bit signed integer array
     elif codec == 7:
-        array = np.frombuffer(raw_bytes, dtype=">i4").astype(np.int32)
-        return _decode_run_length(array)
+        return _decode_run_length(raw_bytes, length)
     # Delta & run-length encoded 32-bit signed integer array
     elif codec == 8:
-        array = np.frombuffer(raw_bytes, dtype=">i4").astype(np.int32)
-        return _decode_delta(
-               _decode_run_length(array))
+        return _decode_run_length(raw_bytes, length, delta=True)
     # Integer & run-length encoded 32-bit floating-point number array
     elif codec == 9:
-        array = np.frombuffer(raw_bytes, dtype=">i4").astype(np.int32)
         return _decode_integer(param, 
-               _decode_run_length(array))
+               _decode_run_length(raw_bytes, length))
     # Integer & delta encoded
     # & two-byte-packed 32-bit floating-point number array
     elif codec == 10:
-        array = np.frombuffer(raw_bytes, dtype=">i2").astype(np.int16)
-        return _decode_integer(param, 
-               _decode_delta(
-               _decode_packed(array)))
+        # Typically used for coordinates
+        # -> decode all steps in a single pass
+        return _decode_packed_delta_integer(raw_bytes, param, length)
     # Integer encoded 32-bit floating-point number array
     elif codec == 11:
         array = np.frombuffer(raw_bytes, dtype=">i2").astype(np.int16)
         return _decode_integer(param, array)
     # Integer & two-byte-packed 32-bit floating-point number array
     elif codec == 12:
-        array = np.frombuffer(raw_bytes, dtype=">i2").astype(np.int16)
         return _decode_integer(param, 
-               _decode_packed(array))
+               _decode_packed(raw_bytes, 2, length))
     # Integer & one-byte-packed 32-bit floating-point number array
     elif codec == 13:
-        array = np.frombuffer(raw_bytes, dtype=">i1").astype(np.int8)
         return _decode_integer(param, 
-               _decode_packed(array))
+               _decode_packed(raw_bytes, 1, length))
     # Two-byte-packed 32-bit signed integer array
     elif codec == 14:
-        array = np.frombuffer(raw_bytes, dtype=">i2").astype(np.int16)
-        return _decode_packed(array)
+        return _decode_packed(raw_bytes, 2, length)
     # One-byte-packed 32-bit signed integer array
     elif codec == 15:
-        array = np.frombuffer(raw_bytes, dtype=">i1").astype(np.int8)
-        return _decode_packed(array)
+        return _decode_packed(raw_bytes, 1, length)
     else:
         raise ValueError("Unknown codec with ID {codec}")
 
 
-def _decode_delta(np.ndarray array):
-    return np.cumsum(array, dtype=np.int32)
-
-
-def _decode_run_length(int32[:] array):
-    cdef int length = 0
-    cdef int i, j
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def _decode_run_length(const uint8[:] raw_bytes, int length,
+                       bint delta=False):
+    """
+    Decode run-length encoded big-endian 32-bit integers.
+    The values are read directly from the encoded bytes,
+    without converting them into an intermediate array first.
+    If `delta` is true, the cumulative sum of the decoded values
+    is computed in the same pass, i.e. the values are additionally
+    delta decoded.
+    """
+    cdef int i, j, k
     cdef int value, repeat
-    # Determine length of output array by summing the run lengths
-    for i in range(1, array.shape[0], 2):
-        length += array[i]
-    cdef int32[:] output = np.zeros(length, dtype=np.int32)
+    cdef int32 cum_val = 0
+    # Each element is written exactly once
+    # -> no initialization required
+    cdef int32[:] output = np.empty(length, dtype=np.int32)
+    cdef bint overflow = False
     # Fill output array
     j = 0
-    for i in range(0, array.shape[0], 2):
-        value = array[i]
-        repeat = array[i+1]
-        output[j : j+repeat] = value
-        j += repeat
+    with nogil:
+        # Each value/repeat pair has 8 bytes
+        for i in range(0, raw_bytes.shape[0] - 7, 8):
+            value = _read_int32(raw_bytes, i)
+            repeat = _read_int32(raw_bytes, i+4)
+            if repeat < 0 or repeat > length - j:
+                overflow = True
+                break
+            if delta:
+                for k in range(j, j+repeat):
+                    cum_val += value
+                    output[k] = cum_val
+            else:
+                for k in range(j, j+repeat):
+                    output[k] = value
+            j += repeat
+    if overflow or j != length:
+        _raise_length_mismatch()
     return np.asarray(output)
 
 
-ctypedef fused PackedType:
-    int8
-    int16
-def _decode_packed(PackedType[:] array):
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def _decode_packed(const uint8[:] raw_bytes, int byte_count, int length):
+    """
+    Decode one-byte or two-byte (big-endian) packed integers.
+    The values are read directly from the encoded bytes,
+    without converting them into an intermediate array first.
+    """
     cdef int min_val, max_val
-    if PackedType is int8:
+    if byte_count == 1:
         min_val = np.iinfo(np.int8).min
         max_val = np.iinfo(np.int8).max
-    else:
+    elif byte_count == 2:
         min_val = np.iinfo(np.int16).min
         max_val = np.iinfo(np.int16).max
+    else:
+        raise ValueError(f"Invalid byte count {byte_count}")
     cdef int i, j
     cdef int packed_val, unpacked_val
-    # Pessimistic size assumption:
-    # The maximum output array length is the input array length
-    # in case all values are within the type limits
-    cdef int32[:] output = np.zeros(array.shape[0], dtype=np.int32)
+    cdef int32[:] output = np.empty(length, dtype=np.int32)
+    cdef bint overflow = False
     j = 0
     unpacked_val = 0
-    for i in range(array.shape[0]):
-        packed_val = array[i]
-        if packed_val == max_val or packed_val == min_val:
-            unpacked_val += packed_val
-        else:
-            unpacked_val += packed_val
-            output[j] = unpacked_val
-            unpacked_val = 0
-            j += 1
-    # Trim to correct size and return
-    return np.asarray(output[:j])
+    with nogil:
+        for i in range(raw_bytes.shape[0] // byte_count):
+            if byte_count == 1:
+                packed_val = <int8> raw_bytes[i]
+            else:
+                packed_val = _read_int16(raw_bytes, 2*i)
+            if packed_val == max_val or packed_val == min_val:
+                unpacked_val += packed_val
+            else:
+                unpacked_val += packed_val
+                if j == length:
+                    overflow = True
+                    break
+                output[j] = unpacked_val
+                unpacked_val = 0
+                j += 1
+    if overflow or j != length:
+        _raise_length_mismatch()
+    return np.asarray(output)
 
 
 def _decode_integer(int divisor, np.ndarray array):
-    return np.divide(array, divisor, dtype=np.float32)
\ No newline at end of file
+    return np.divide(array, divisor, dtype=np.float32)
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+@cython.cdivision(True)
+def _decode_packed_delta_integer(const uint8[:] raw_bytes, int divisor,
+                                 int length):
+    """
+    Decode big-endian two-byte-packed integers, take the cumulative
+    sum of the unpacked values (delta decoding) and divide it by the
+    `divisor`.
+    Equivalent to :func:`_decode_packed()` followed by a cumulative
+    sum and :func:`_decode_integer()`, but without intermediate arrays.
+    """
+    cdef int min_val = np.iinfo(np.int16).min
+    cdef int max_val = np.iinfo(np.int16).max
+    cdef int i, j
+    cdef int packed_val, unpacked_val
+    cdef int32 delta_val
+    cdef float32 float_divisor = divisor
+    cdef float32[:] output = np.empty(length, dtype=np.float32)
+    cdef bint overflow = False
+    j = 0
+    unpacked_val = 0
+    delta_val = 0
+    with nogil:
+        for i in range(0, raw_bytes.shape[0] - 1, 2):
+            packed_val = _read_int16(raw_bytes, i)
+            unpacked_val += packed_val
+            if packed_val != max_val and packed_val != min_val:
+                if j == length:
+                    overflow = True
+                    break
+                delta_val += unpacked_val
+                output[j] = <float32> delta_val / float_divisor
+                unpacked_val = 0
+                j += 1
+    if overflow or j != length:
+        _raise_length_mismatch()
+    return np.asarray(output)
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+cdef inline int16 _read_int16(const uint8[:] raw_bytes, int i) nogil:
+    """
+    Read a big-endian 16-bit integer starting at the given byte index.
+    """
+    return <int16> ((<uint16> raw_bytes[i] << 8) | <uint16> raw_bytes[i+1])
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+cdef inline int32 _read_int32(const uint8[:] raw_bytes, int i) nogil:
+    """
+    Read a big-endian 32-bit integer starting at the given byte index.
+    """
+    return <int32> (
+        (<uint32> raw_bytes[i  ] << 24) |
+        (<uint32> raw_bytes[i+1] << 16) |
+        (<uint32> raw_bytes[i+2] <<  8) |
+        (<uint32> raw_bytes[i+3]      )
+    )
+
+
+def _raise_length_mismatch():
+    raise ValueError(
+        "The length of the decoded array does not match the length "
+        "given in the header"
+    )
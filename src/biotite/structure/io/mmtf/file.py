@@ -18,6 +18,10 @@ from .decode import decode_array
 from .encode import encode_array
 
 
+# The header of an encoded array: codec, length and parameter
+_HEADER = struct.Struct(">iii")
+
+
 class MMTFFile(File, MutableMapping):
     """
     This class represents a MMTF file.
@@ -122,7 +126,7 @@ class MMTFFile(File, MutableMapping):
         """
         data = self._content[key]
         if isinstance(data, bytes) and data[0] == 0:
-            codec = struct.unpack(">i", data[0:4])[0]
+            codec = _HEADER.unpack_from(data)[0]
             return codec
         else:
             return None
@@ -144,7 +148,7 @@ class MMTFFile(File, MutableMapping):
         """
         data = self._content[key]
         if isinstance(data, bytes) and data[0] == 0:
-            length = struct.unpack(">i", data[4:8])[0]
+            length = _HEADER.unpack_from(data)[1]
             return length
         else:
             return None
@@ -166,7 +170,7 @@ class MMTFFile(File, MutableMapping):
         """
         data = self._content[key]
         if isinstance(data, bytes) and data[0] == 0:
-            param = struct.unpack(">i", data[8:12])[0]
+            param = _HEADER.unpack_from(data)[2]
             return param
         else:
             return None
@@ -174,21 +178,17 @@ class MMTFFile(File, MutableMapping):
     def set_array(self, key, array, codec, param=0):
         length = len(array)
         raw_bytes = encode_array(array, codec, param)
-        data = struct.pack(">i", codec) \
-             + struct.pack(">i", length) \
-             + struct.pack(">i", param) \
-             + raw_bytes
+        data = _HEADER.pack(codec, length, param) + raw_bytes
         self._content[key] = data
     
     def __getitem__(self, key):
         data = self._content[key]
         if isinstance(data, bytes) and data[0] == 0:
             # MMTF specific format -> requires decoding
-            codec     = struct.unpack(">i", data[0:4 ])[0]
-            length    = struct.unpack(">i", data[4:8 ])[0]
-            param     = struct.unpack(">i", data[8:12])[0]
-            raw_bytes = data[12:]
-            return decode_array(codec, raw_bytes, param)
+            codec, length, param = _HEADER.unpack_from(data)
+            # Use a view to avoid copying the encoded data
+            raw_bytes = memoryview(data)[_HEADER.size:]
+            return decode_array(codec, raw_bytes, param, length)
         else:
             return data
     
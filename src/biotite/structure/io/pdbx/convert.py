@@ -81,8 +81,10 @@ def get_model_count(file, data_block=None):
     model_count : int
         The number of models.
     """
-    atom_site_dict = file.get_category("atom_site", data_block)
-    return len(_get_model_starts(atom_site_dict["pdbx_PDB_model_num"]))
+    # Only the model numbers are required
+    # -> avoid parsing the entire 'atom_site' category
+    models = file._get_column("atom_site", "pdbx_PDB_model_num", data_block)
+    return len(_get_model_starts(models))
 
 
 def get_structure(pdbx_file, model=None, data_block=None, altloc="first",
@@ -6,8 +6,10 @@ __name__ = "biotite.structure.io.pdbx"
 __author__ = "Patrick Kunzmann"
 __all__ = ["PDBxFile"]
 
+import sys
 import shlex
 import copy
+import bisect
 from collections.abc import MutableMapping
 import numpy as np
 from ....file import TextFile
@@ -84,6 +86,9 @@ class PDBxFile(TextFile, MutableMapping):
         # together with its line position in the file
         # and the data_block it is in
         self._categories = {}
+        # The sorted names of all data blocks in the file,
+        # kept up to date when categories are added
+        self._block_names = []
     
     
     @classmethod
@@ -167,11 +172,7 @@ class PDBxFile(TextFile, MutableMapping):
         blocks : list
             List of data block names.
         """
-        blocks = set()
-        for category_tuple in self._categories.keys():
-            block, _ = category_tuple
-            blocks.add(block)
-        return sorted(blocks)
+        return copy.copy(self._block_names)
     
     
     def get_category(self, category, block=None, expect_looped=False):
@@ -201,64 +202,13 @@ class PDBxFile(TextFile, MutableMapping):
             category.
         """
         if block is None:
-            block = self.get_block_names()[0]
+            block = self._block_names[0]
         category_info = self._categories.get((block, category))
         if category_info is None:
             return None
-        start = category_info["start"]
-        stop = category_info["stop"]
-        is_loop = category_info["loop"]
-        is_multilined = category_info["multiline"]
+        category_dict = self._parse_category(category, category_info)
         
-        if is_multilined:
-            # Convert multiline values into singleline values
-            prelines = [line.strip() for line in self.lines[start:stop]
-                         if not _is_empty(line) and not _is_loop_start(line)]
-            lines = (len(prelines)) * [None]
-            # lines index
-            k = 0
-            # prelines index
-            i = 0
-            while i < len(prelines):
-                if prelines[i][0] == ";":
-                    # multiline values
-                    multi_line_str = prelines[i][1:]
-                    j = i+1
-                    while prelines[j] != ";":
-                        multi_line_str += prelines[j]
-                        j += 1
-                    lines[k-1] += " " + shlex.quote(multi_line_str)
-                    i = j+1
-                elif not is_loop and prelines[i][0] in ["'",'"']:
-                    # Singleline values where value is in the line
-                    # after the corresponding key
-                    lines[k-1] += " " + prelines[i]
-                    i += 1
-                else:    
-                    # Normal singleline value in the same row as the key
-                    lines[k] = prelines[i]
-                    i += 1
-                    k += 1
-            lines = [line for line in lines if line is not None]
-            
-        else:
-            lines = [line.strip() for line in self.lines[start:stop]
-                     if not _is_empty(line) and not _is_loop_start(line)]
-        
-        if is_loop:
-            # Special optimization for "atom_site":
-            # Even if the values are quote protected,
-            # no whitespace is expected in escaped values
-            # Therefore slow shlex.split() call is not necessary
-            if category == "atom_site":
-                whitespace_values = False
-            else:
-                whitespace_values = True
-            category_dict = _process_looped(lines, whitespace_values)
-        else:
-            category_dict = _process_singlevalued(lines)
-        
-        if expect_looped and not is_loop:
+        if expect_looped and not category_info["loop"]:
             category_dict = {key: np.array([val], dtype=object)
                              for key, val in category_dict.items()}
 
@@ -288,7 +238,7 @@ class PDBxFile(TextFile, MutableMapping):
             appended at the end of the file.
         """
         if block is None:
-            block = self.get_block_names()[0]
+            block = self._block_names[0]
         
         
         # Determine whether the category is a looped category
@@ -399,7 +349,7 @@ class PDBxFile(TextFile, MutableMapping):
             # When writing a category no multiline values are used
             category_info["multiline"] = False
             category_info["loop"] = is_looped
-        elif block in self.get_block_names():
+        elif block in self._block_names:
             # Data block exists but not the category
             # Find last category in the block
             # and set start of new category to stop of last category
@@ -442,6 +392,7 @@ class PDBxFile(TextFile, MutableMapping):
     def __copy_fill__(self, clone):
         super().__copy_fill__(clone)
         clone._categories = copy.deepcopy(self._categories)
+        clone._block_names = copy.copy(self._block_names)
         
         
     def __setitem__(self, index, item):
@@ -483,6 +434,92 @@ class PDBxFile(TextFile, MutableMapping):
         return len(self._categories)
     
     
+    def _get_column(self, category, key, block=None):
+        """
+        Get the values of a single key of a category as array.
+        
+        For a *looped* category only the values of the given key are
+        processed, which is faster than parsing the entire category via
+        :func:`get_category()`.
+        Returns None, if the data block does not contain the given
+        category or key.
+        """
+        if block is None:
+            block = self._block_names[0]
+        category_info = self._categories.get((block, category))
+        if category_info is None:
+            return None
+        category_dict = self._parse_category(
+            category, category_info, keys=[key]
+        )
+        column = category_dict.get(key)
+        if column is not None and not category_info["loop"]:
+            column = np.array([column], dtype=object)
+        return column
+    
+    
+    def _parse_category(self, category, category_info, keys=None):
+        """
+        Parse the lines of a category into a dictionary.
+        
+        If `keys` is given, only these keys are included for a *looped*
+        category.
+        """
+        start = category_info["start"]
+        stop = category_info["stop"]
+        is_loop = category_info["loop"]
+        is_multilined = category_info["multiline"]
+        
+        if is_multilined:
+            # Convert multiline values into singleline values
+            prelines = [line.strip() for line in self.lines[start:stop]
+                         if not _is_empty(line) and not _is_loop_start(line)]
+            lines = (len(prelines)) * [None]
+            # lines index
+            k = 0
+            # prelines index
+            i = 0
+            while i < len(prelines):
+                if prelines[i][0] == ";":
+                    # multiline values
+                    multi_line_str = prelines[i][1:]
+                    j = i+1
+                    while prelines[j] != ";":
+                        multi_line_str += prelines[j]
+                        j += 1
+                    lines[k-1] += " " + shlex.quote(multi_line_str)
+                    i = j+1
+                elif not is_loop and prelines[i][0] in ["'",'"']:
+                    # Singleline values where value is in the line
+                    # after the corresponding key
+                    lines[k-1] += " " + prelines[i]
+                    i += 1
+                else:    
+                    # Normal singleline value in the same row as the key
+                    lines[k] = prelines[i]
+                    i += 1
+                    k += 1
+            lines = [line for line in lines if line is not None]
+            
+        else:
+            lines = [line.strip() for line in self.lines[start:stop]
+                     if not _is_empty(line) and not _is_loop_start(line)]
+        
+        if is_loop:
+            # Special optimization for "atom_site":
+            # Even if the values are quote protected,
+            # no whitespace is expected in escaped values
+            # Therefore slow shlex.split() call is not necessary
+            if category == "atom_site":
+                whitespace_values = False
+            else:
+                whitespace_values = True
+            category_dict = _process_looped(lines, whitespace_values, keys)
+        else:
+            category_dict = _process_singlevalued(lines)
+        return category_dict
+    
+    
     def _full_index(self, index):
         """
         Converts a an integer or tuple index into a block and a category
@@ -491,7 +528,7 @@ class PDBxFile(TextFile, MutableMapping):
         if isinstance(index, tuple):
             return index[0], index[1]
         elif isinstance(index, str):
-            return self.get_block_names()[0], index
+            return self._block_names[0], index
         else:
             raise TypeError(
                 f"'{type(index).__name__}' is an invalid index type"
@@ -504,6 +541,14 @@ class PDBxFile(TextFile, MutableMapping):
         # the current_category is None
         # This is checked before adding an entry
         if category_name is not None:
+            # The same block and category names appear in many files
+            # -> share the string objects between all files
+            # 'str()' is required, as 'sys.intern()' does not accept
+            # subclasses of 'str', e.g. 'np.str_'
+            block = sys.intern(str(block))
+            category_name = sys.intern(str(category_name))
+            if block not in self._block_names:
+                bisect.insort(self._block_names, block)
             self._categories[
                 (block, category_name)] = {"start"     : start,
                                            "stop"      : stop,
@@ -529,48 +574,48 @@ def _process_singlevalued(lines):
     return category_dict
 
 
-def _process_looped(lines, whitepace_values):
-    category_dict = {}
+def _process_looped(lines, whitepace_values, selected_keys=None):
     keys = []
-    # Array index
-    i = 0
-    # Dictionary key index
-    j = 0
+    # The values of all keys in the order of appearance
+    values = []
     for line in lines:
         if line[0] == "_":
             # Key line
-            key = line.split(".")[1]
-            keys.append(key)
-            # Pessimistic array allocation
-            # numpy array filled with strings
-            category_dict[key] = np.zeros(len(lines), dtype=object)
-            keys_length = len(keys)
+            keys.append(sys.intern(line.split(".")[1]))
+        # If whitespace is expected in quote protected values,
+        # use standard shlex split
+        # Otherwise use much more faster whitespace split
+        # and quote removal if applicable,
+        # bypassing the slow shlex module 
+        elif whitepace_values:
+            values += shlex.split(line)
         else:
-            # If whitespace is expected in quote protected values,
-            # use standard shlex split
-            # Otherwise use much more faster whitespace split
-            # and quote removal if applicable,
-            # bypassing the slow shlex module 
-            if whitepace_values:
-                values = shlex.split(line)
-            else:
-                values = line.split()
-                for k in range(len(values)):
-                    # Remove quotes
-                    if ((values[k][0] == '"' and values[k][-1] == '"') or
-                        (values[k][0] == "'" and values[k][-1] == "'")):
-                            values[k] = values[k][1:-1]
-            for value in values:
-                category_dict[keys[j]][i] = value
-                j += 1
-                if j == keys_length:
-                    # If all keys have been filled with a value,
-                    # restart with first key with incremented index
-                    j = 0
-                    i += 1
-    for key in category_dict.keys():
-        # Trim to correct size
-        category_dict[key] = category_dict[key][:i]
+            # The quotes are removed later for each column separately,
+            # so that only the columns of selected keys are processed
+            values += line.split()
+    if len(keys) == 0:
+        # Without keys, no values can be assigned
+        return {}
+    # Ignore values of incomplete rows
+    # The list is trimmed in place to avoid a temporary copy of it
+    row_count = len(values) // len(keys)
+    del values[row_count * len(keys):]
+    category_dict = {}
+    for j, key in enumerate(keys):
+        if selected_keys is not None and key not in selected_keys:
+            continue
+        # The values of a key appear in every n-th position,
+        # where n is the number of keys
+        column = values[j::len(keys)]
+        if not whitepace_values:
+            column = [
+                value[1:-1] if value[0] == value[-1] and value[0] in "'\""
+                else value
+                for value in column
+            ]
+        # Each column is an independent array, so that keeping a single
+        # column does not keep the values of all other keys alive
+        category_dict[key] = np.array(column, dtype=object)
     return category_dict
     
 
@@ -78,6 +78,21 @@ def test_modification(atom, array, stack):
     assert stack.stack_depth() == 2
 
 
+def test_atom_attribute(atom):
+    # Attributes that are not annotations can be set as well
+    atom.foo = 3
+    assert atom.foo == 3
+    assert "foo" not in struc.array([atom]).get_annotation_categories()
+
+
+def test_array_creation(atom_list, array):
+    for i, atom in enumerate(atom_list):
+        assert array[i] == atom
+    # Annotation categories beyond the default ones
+    atoms = [struc.Atom([i,i,i], b_factor=float(i)) for i in range(3)]
+    assert struc.array(atoms).b_factor.tolist() == [0.0, 1.0, 2.0]
+
+
 def test_array_indexing(atom, array):
     filtered_array = array[array.chain_id == "B"]
     assert filtered_array.res_name.tolist() == ["PRO","PRO","MSE"] 
@@ -117,7 +132,9 @@ def test_comparison(array):
     assert mod_array != array
     mod_array = array.copy()
     mod_array.res_name[0] = "UNK"
-    mod_array != array
+    assert mod_array != array
+    assert array[:-1] != array
+    assert array != 42
 
 
 def test_bonds(array):
@@ -46,6 +46,48 @@ def test_codecs(path):
                 assert (array1 == array2).all()
 
 
+@pytest.mark.parametrize(
+    "codec, header_length",
+    itertools.product([7, 10, 14, 15], [99, 101])
+)
+def test_length_mismatch(codec, header_length):
+    """
+    Check whether an encoded array, whose length does not match the
+    length in its header, raises an exception instead of being
+    decoded.
+    A header length smaller than the actual length must not lead to
+    writing beyond the end of the output array.
+    """
+    mmtf_file = mmtf.MMTFFile()
+    mmtf_file.set_array("array", np.arange(100), codec, 1000)
+    data = mmtf_file._content["array"]
+    # Manipulate the length in the header
+    mmtf_file._content["array"] = data[:4] \
+                                + header_length.to_bytes(4, "big") \
+                                + data[8:]
+    with pytest.raises(ValueError):
+        mmtf_file["array"]
+
+
+def test_negative_run_length():
+    """
+    Check whether a negative run length in run-length encoded data
+    raises an exception, even if the sum of all run lengths matches
+    the length in the header.
+    """
+    mmtf_file = mmtf.MMTFFile()
+    # 100 value/run length pairs with a run length of 1 each
+    mmtf_file.set_array("array", np.arange(100), 7)
+    data = bytearray(mmtf_file._content["array"])
+    # The data starts after the 12 byte header,
+    # the first run length is at byte 16, the second one at byte 24
+    data[16:20] = (-1).to_bytes(4, "big", signed=True)
+    data[24:28] = (3).to_bytes(4, "big", signed=True)
+    mmtf_file._content["array"] = bytes(data)
+    with pytest.raises(ValueError):
+        mmtf_file["array"]
+
+
 @pytest.mark.parametrize(
     "path, model",
     itertools.product(
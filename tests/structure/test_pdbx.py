@@ -11,6 +11,7 @@ from pytest import approx
 import biotite
 import biotite.structure as struc
 import biotite.structure.io.pdbx as pdbx
+import biotite.structure.io.pdbx.file as pdbx_file_module
 import biotite.sequence as seq
 from ..util import data_dir
 
@@ -49,6 +50,22 @@ def test_parsing(category, key, exp_value):
         assert value == exp_value
 
 
+def test_looped_columns():
+    """
+    Check whether the columns of a looped category are independent
+    arrays, so that a single column does not keep the values of the
+    entire category alive.
+    Furthermore, a loop without keys must not raise an exception.
+    """
+    pdbx_file = pdbx.PDBxFile.read(join(data_dir("structure"), "1l2y.cif"))
+    atom_site = pdbx_file["atom_site"]
+    for column in atom_site.values():
+        assert column.base is None
+    assert atom_site["Cartn_x"].tolist()[:2] == ["-8.901", "-8.608"]
+
+    assert pdbx_file_module._process_looped(["1 2"], True) == {}
+
+
 @pytest.mark.parametrize(
     "string, use_array",
     itertools.product(
@@ -172,7 +189,63 @@ def test_unequal_lengths():
             "test", invalid_category_dict, block="test_block"
         )
             
-        
+
+
+def test_block_names():
+    category_dict = {"foo" : "1"}
+    pdbx_file = pdbx.PDBxFile()
+    pdbx_file.set_category("test", category_dict, block="b_block")
+    pdbx_file.set_category("test", category_dict, block="a_block")
+    assert pdbx_file.get_block_names() == ["a_block", "b_block"]
+    # The first data block in alphabetical order is the default one
+    assert pdbx_file["test"] == category_dict
+    assert pdbx_file.copy().get_block_names() == ["a_block", "b_block"]
+
+
+def test_numpy_string_names():
+    """
+    Check whether block and category names may be given as
+    :class:`numpy.str_`, e.g. if they are taken from an array.
+    """
+    category_dict = {"foo" : "1"}
+    pdbx_file = pdbx.PDBxFile()
+    pdbx_file.set_category(
+        np.str_("test"), category_dict, block=np.str_("test_block")
+    )
+    assert pdbx_file.get_block_names() == ["test_block"]
+    assert pdbx_file.get_category("test", block="test_block") \
+           == category_dict
+
+
+def test_repeated_category_access():
+    """
+    Check that a category returned repeatedly by :func:`get_category()`
+    is independent of modifications of previously returned values
+    and reflects changes via :func:`set_category()`.
+    Furthermore, check that the values of single keys obtained via
+    :func:`_get_column()` equal the values in the entire category.
+    """
+    pdbx_file = pdbx.PDBxFile.read(join(data_dir("structure"), "1l2y.cif"))
+    ref_atom_site = pdbx_file.get_category("atom_site")
+    atom_site = pdbx_file.get_category("atom_site")
+    atom_site["id"][0] = "foo"
+    atom_site = pdbx_file.get_category("atom_site")
+    for key in ref_atom_site:
+        assert atom_site[key].tolist() == ref_atom_site[key].tolist()
+        assert pdbx_file._get_column("atom_site", key).tolist() \
+               == ref_atom_site[key].tolist()
+    assert pdbx_file._get_column("atom_site", "foo") is None
+    assert pdbx_file._get_column("foo", "id") is None
+    
+    # Non-looped category
+    entity = pdbx_file.get_category("entity")
+    assert pdbx_file._get_column("entity", "type").tolist() \
+           == [entity["type"]]
+    entity["type"] = "foo"
+    pdbx_file.set_category("entity", entity)
+    assert pdbx_file.get_category("entity")["type"] == "foo"
+
+
 def test_list_assemblies():
     """
     Test the :func:`list_assemblies()` function based on a known